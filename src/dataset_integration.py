@@ -27,10 +27,15 @@ class DatasetIntegrator:
         self.respiratory = None
         self.covid19 = None
         self.skin_disease = None
+        # Lookup results per (name, filter); the datasets are read-only once loaded
+        self._herb_effectiveness_cache = {}
+        self._drug_effectiveness_cache = {}
         
     def load_all_datasets(self) -> Dict[str, pd.DataFrame]:
         """Load all available datasets"""
         datasets = {}
+        self._herb_effectiveness_cache.clear()
+        self._drug_effectiveness_cache.clear()
         
         try:
             self.medicinal_plants = self.load_medicinal_plants()
@@ -167,6 +172,12 @@ class DatasetIntegrator:
         if self.medicinal_plants is None:
             return None
         
+        key = (herb_name, classification)
+        if key not in self._herb_effectiveness_cache:
+            self._herb_effectiveness_cache[key] = self._lookup_herb_effectiveness(herb_name, classification)
+        return self._herb_effectiveness_cache[key]
+    
+    def _lookup_herb_effectiveness(self, herb_name: str, classification: str = None) -> Optional[float]:
         # Case-insensitive search
         herb_lower = herb_name.lower()
         matches = self.medicinal_plants[
@@ -192,6 +203,13 @@ class DatasetIntegrator:
         if self.drug_reviews is None:
             return None
         
+        key = (drug_name, condition)
+        if key not in self._drug_effectiveness_cache:
+            self._drug_effectiveness_cache[key] = self._lookup_drug_effectiveness(drug_name, condition)
+        cached = self._drug_effectiveness_cache[key]
+        return dict(cached) if cached is not None else None
+    
+    def _lookup_drug_effectiveness(self, drug_name: str, condition: str = None) -> Optional[Dict]:
         # Case-insensitive search (regex=False to treat as literal string)
         drug_lower = drug_name.lower()
         matches = self.drug_reviews[
@@ -225,8 +225,7 @@ def find_matching_pattern(symptoms: str) -> Tuple[str, Dict]:
         if pattern_name not in TRAVEL_PATTERNS:
             continue
         pattern_data = TRAVEL_PATTERNS[pattern_name]
-        match_count = sum(1 for keyword in pattern_data["keywords"] 
-                         if keyword in symptoms_lower)
+        match_count = sum(keyword in symptoms_lower for keyword in pattern_data["keywords"])
         
         # IMMEDIATE RETURN for menstrual pattern (highest priority)
         if pattern_name == "menstrual_reproductive" and match_count > 0:
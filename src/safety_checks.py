@@ -3,6 +3,62 @@ Medical Safety Checks Module
 QUICK WIN #4: Emergency detection and confidence warnings
 """
 
+import re
+
+# Critical emergency keywords
+EMERGENCY_KEYWORDS = [
+    'chest pain',
+    'heart attack',
+    'severe chest pain',
+    'crushing chest pain',
+    'chest pressure',
+    'heart feels like',  # covers "heart feels like it's being crushed"
+    'stroke',
+    'can\'t breathe',
+    'cannot breathe',
+    'difficulty breathing',
+    'choking',
+    'severe bleeding',
+    'heavy bleeding',
+    'bleeding heavily',
+    'unconscious',
+    'loss of consciousness',
+    'passed out',
+    'suicide',
+    'suicidal',
+    'kill myself',
+    'end my life',
+    'seizure',
+    'convulsion',
+    'anaphylaxis',
+    'severe allergic reaction',
+    'throat closing',
+    'can\'t swallow',
+    'severe burn',
+    'severe trauma',
+    'head injury',
+    'severe head pain',
+    'worst headache of my life',
+    'sudden severe headache',
+    'coughing blood',
+    'coughing up blood',
+    'vomiting blood',
+    'blood in vomit',
+    'blood in stool',
+    'severe abdominal pain',
+    'sudden vision loss',
+    'sudden paralysis',
+    'numbness on one side',
+    'slurred speech',
+    'confusion and fever',
+    'stiff neck and fever',
+    'severe dehydration'
+]
+
+# One alternation so a single search covers every keyword
+EMERGENCY_RE = re.compile("|".join(map(re.escape, EMERGENCY_KEYWORDS)))
+
+
 def check_emergency_keywords(user_input: str) -> dict:
     """
     QUICK WIN #4A: Emergency Detection
@@ -18,62 +74,11 @@ def check_emergency_keywords(user_input: str) -> dict:
     
     text_lower = user_input.lower().strip()
     
-    # Critical emergency keywords
-    emergency_keywords = [
-        'chest pain',
-        'heart attack',
-        'severe chest pain',
-        'crushing chest pain',
-        'chest pressure',
-        'heart feels like',  # covers "heart feels like it's being crushed"
-        'stroke',
-        'can\'t breathe',
-        'cannot breathe',
-        'difficulty breathing',
-        'choking',
-        'severe bleeding',
-        'heavy bleeding',
-        'bleeding heavily',
-        'unconscious',
-        'loss of consciousness',
-        'passed out',
-        'suicide',
-        'suicidal',
-        'kill myself',
-        'end my life',
-        'seizure',
-        'convulsion',
-        'anaphylaxis',
-        'severe allergic reaction',
-        'throat closing',
-        'can\'t swallow',
-        'severe burn',
-        'severe trauma',
-        'head injury',
-        'severe head pain',
-        'worst headache of my life',
-        'sudden severe headache',
-        'coughing blood',
-        'coughing up blood',
-        'vomiting blood',
-        'blood in vomit',
-        'blood in stool',
-        'severe abdominal pain',
-        'sudden vision loss',
-        'sudden paralysis',
-        'numbness on one side',
-        'slurred speech',
-        'confusion and fever',
-        'stiff neck and fever',
-        'severe dehydration'
-    ]
-    
     # Check for emergency keywords
-    for keyword in emergency_keywords:
-        if keyword in text_lower:
-            return {
-                'is_emergency': True,
-                'message': """
+    if EMERGENCY_RE.search(text_lower):
+        return {
+            'is_emergency': True,
+            'message': """
 ╔═══════════════════════════════════════════════════════════════════╗
 ║                    🚨 MEDICAL EMERGENCY DETECTED 🚨                ║
 ╚═══════════════════════════════════════════════════════════════════╝
@@ -96,7 +101,7 @@ def check_emergency_keywords(user_input: str) -> dict:
 
 ═══════════════════════════════════════════════════════════════════
 """
-            }
+        }
     
     return {'is_emergency': False, 'message': ''}
 
@@ -21,6 +21,39 @@ class SeverityScore:
     recommendations: List[str]  # Action items
     urgent: bool  # Requires immediate attention
 
+def _score_kernel(severe: int, moderate: int, mild: int, duration_severe: int,
+                  duration_moderate: int, impact: int, progression: int) -> int:
+    """Combine keyword match counts into the raw 0-100+ severity score"""
+    score = 0
+    
+    # Severe keywords (+30 points each, max 60)
+    if severe:
+        score += min(severe * 30, 60)
+    
+    # Moderate keywords (+15 points each, max 30)
+    if moderate:
+        score += min(moderate * 15, 30)
+    
+    # Mild keywords (-10 points, but never below 0)
+    if mild:
+        score = max(0, score - 10)
+    
+    # Duration (longer = worse)
+    if duration_severe:
+        score += 20
+    elif duration_moderate:
+        score += 10
+    
+    # Functional impact (+40 points)
+    if impact:
+        score += 40
+    
+    # Progression (+20 points)
+    if progression:
+        score += 20
+    
+    return score
+
 class SeverityClassifier:
     """Classify symptom severity"""
     
@@ -80,6 +113,25 @@ class SeverityClassifier:
             'getting worse', 'worsening', 'spreading', 'increasing',
             'progressively', 'deteriorating', 'declining'
         }
+        
+        # Scoring groups scanned by analyze_severity, frozen once into sorted
+        # tuples so each call walks the same order instead of the raw sets
+        self._keyword_table = tuple(
+            (group, tuple(sorted(keywords)))
+            for group, keywords in (
+                ('severe', self.severe_keywords),
+                ('moderate', self.moderate_keywords),
+                ('mild', self.mild_keywords),
+                ('duration_severe', self.duration_severe),
+                ('duration_moderate', self.duration_moderate),
+                ('impact', self.impact_severe),
+                ('progression', self.progression_keywords),
+            )
+        )
+        self._emergency_table = tuple(sorted(self.emergency_keywords))
+        # First letters of the emergency keywords: a keyword can only match if
+        # its first letter occurs somewhere in the text
+        self._emergency_first_chars = frozenset(kw[0] for kw in self.emergency_keywords)
     
     def analyze_severity(self, symptoms: str, disease: str = None) -> SeverityScore:
         """
@@ -93,11 +145,14 @@ class SeverityClassifier:
             SeverityScore object with level and recommendations
         """
         symptoms_lower = symptoms.lower()
-        score = 0
         factors = []
         
         # Check for emergency keywords (immediate override)
-        emergency_matches = [kw for kw in self.emergency_keywords if kw in symptoms_lower]
+        present = self._emergency_first_chars.intersection(symptoms_lower)
+        emergency_matches = [
+            kw for kw in self._emergency_table
+            if kw[0] in present and kw in symptoms_lower
+        ] if present else []
         if emergency_matches:
             return SeverityScore(
                 level="Emergency",
@@ -111,46 +166,34 @@ class SeverityClassifier:
                 urgent=True
             )
         
-        # Score severe keywords (+30 points each, max 60)
-        severe_matches = [kw for kw in self.severe_keywords if kw in symptoms_lower]
-        if severe_matches:
-            score += min(len(severe_matches) * 30, 60)
-            factors.extend([f"Severe intensity: '{kw}'" for kw in severe_matches[:2]])
-        
-        # Score moderate keywords (+15 points each, max 30)
-        moderate_matches = [kw for kw in self.moderate_keywords if kw in symptoms_lower]
-        if moderate_matches:
-            score += min(len(moderate_matches) * 15, 30)
-            factors.extend([f"Moderate intensity: '{kw}'" for kw in moderate_matches[:2]])
-        
-        # Score mild keywords (-10 points, but never below 0)
-        mild_matches = [kw for kw in self.mild_keywords if kw in symptoms_lower]
-        if mild_matches:
-            score = max(0, score - 10)
-            factors.append(f"Mild indicator: '{mild_matches[0]}'")
-        
-        # Score duration (longer = worse)
-        duration_severe_matches = [kw for kw in self.duration_severe if kw in symptoms_lower]
-        if duration_severe_matches:
-            score += 20
-            factors.append(f"Chronic duration: '{duration_severe_matches[0]}'")
-        
-        duration_moderate_matches = [kw for kw in self.duration_moderate if kw in symptoms_lower]
-        if duration_moderate_matches and not duration_severe_matches:
-            score += 10
-            factors.append(f"Extended duration: '{duration_moderate_matches[0]}'")
-        
-        # Score functional impact (+40 points)
-        impact_matches = [kw for kw in self.impact_severe if kw in symptoms_lower]
-        if impact_matches:
-            score += 40
-            factors.extend([f"Functional impact: '{kw}'" for kw in impact_matches[:2]])
+        matches = {
+            group: [kw for kw in keywords if kw in symptoms_lower]
+            for group, keywords in self._keyword_table
+        }
+        score = _score_kernel(
+            len(matches['severe']),
+            len(matches['moderate']),
+            len(matches['mild']),
+            len(matches['duration_severe']),
+            len(matches['duration_moderate']),
+            len(matches['impact']),
+            len(matches['progression'])
+        )
         
-        # Score progression (+20 points)
-        progression_matches = [kw for kw in self.progression_keywords if kw in symptoms_lower]
-        if progression_matches:
-            score += 20
-            factors.append(f"Progressive: '{progression_matches[0]}'")
+        if matches['severe']:
+            factors.extend([f"Severe intensity: '{kw}'" for kw in matches['severe'][:2]])
+        if matches['moderate']:
+            factors.extend([f"Moderate intensity: '{kw}'" for kw in matches['moderate'][:2]])
+        if matches['mild']:
+            factors.append(f"Mild indicator: '{matches['mild'][0]}'")
+        if matches['duration_severe']:
+            factors.append(f"Chronic duration: '{matches['duration_severe'][0]}'")
+        elif matches['duration_moderate']:
+            factors.append(f"Extended duration: '{matches['duration_moderate'][0]}'")
+        if matches['impact']:
+            factors.extend([f"Functional impact: '{kw}'" for kw in matches['impact'][:2]])
+        if matches['progression']:
+            factors.append(f"Progressive: '{matches['progression'][0]}'")
         
         # Disease-specific severity adjustments
         if disease:
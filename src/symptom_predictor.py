@@ -1,8 +1,6 @@
 import pandas as pd
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.linear_model import LogisticRegression
-from sklearn.calibration import CalibratedClassifierCV  # QUICK WIN #3: Probability calibration
 import joblib
+import functools
 import re
 import os
 
@@ -56,6 +54,11 @@ def preprocess_kaggle_dataset(data_path):
 
 # ---------- Model Training ----------
 def train_symptom_model(data_path="data/symptom_disease.csv", out_path="data/symptom_model.pkl"):
+    # sklearn is only needed to train; prediction gets it via unpickling
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.calibration import CalibratedClassifierCV  # QUICK WIN #3: Probability calibration
+
     df = preprocess_kaggle_dataset(data_path)
 
     # QUICK WIN #2: Bigrams to capture multi-word phrases ("chest pain", "sore throat")
@@ -87,9 +90,25 @@ def train_symptom_model(data_path="data/symptom_disease.csv", out_path="data/sym
     print("✅ Model calibrated successfully!")
 
     os.makedirs("data", exist_ok=True)
-    joblib.dump((vectorizer, model), out_path)
+    # Dumped next to out_path and renamed over it: a process that still has
+    # the old model memory-mapped keeps reading the old file instead of
+    # having it rewritten underneath it (SIGBUS)
+    tmp_path = f"{out_path}.{os.getpid()}.tmp"
+    try:
+        joblib.dump((vectorizer, model), tmp_path)
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    _load_symptom_model.cache_clear()
     print(f"✅ Symptom → Disease model trained and saved to {out_path}")
 
+@functools.lru_cache(maxsize=4)
+def _load_symptom_model(model_path):
+    """(vectorizer, model) from disk, once per path; arrays stay memory-mapped"""
+    return joblib.load(model_path, mmap_mode='r')
+
 # ---------- Prediction ----------
 def predict_disease(prompt, model_path="data/symptom_model.pkl"):
     """
@@ -107,7 +126,7 @@ def predict_disease(prompt, model_path="data/symptom_model.pkl"):
     
     from difflib import SequenceMatcher
     
-    vectorizer, model = joblib.load(model_path)
+    vectorizer, model = _load_symptom_model(model_path)
     prompt_clean = clean_text(prompt)
     
     # Step 1: Try to match against known disease names directly
@@ -9,6 +9,7 @@ All Rights Reserved - Proprietary Software
 import streamlit as st
 import sys
 import os
+import re
 import json
 from typing import Optional, Dict, List
 
@@ -78,63 +79,68 @@ DISEASE_ALIASES = {
     "pharyngitis": "strep throat"
 }
 
-def count_diagnostic_symptoms(symptoms: str, disease: str) -> int:
-    """Count how many diagnostic symptoms are present"""
-    symptoms_lower = symptoms.lower()
+# One pattern per disease, built once. The lookahead reports a match at every
+# start position, so overlapping symptoms are all found in a single scan.
+# A disease with no symptoms gets no pattern (it would match the empty string)
+_DIAGNOSTIC_PATTERNS = {
+    disease: re.compile(
+        "(?=(" + "|".join(re.escape(s) for s in sorted(symptoms, key=len, reverse=True)) + "))"
+    )
+    for disease, symptoms in DIAGNOSTIC_SYMPTOMS.items()
+    if symptoms
+}
+# Each match is the longest symptom starting at that position; every shorter
+# symptom of the same disease starting there is one of its prefixes
+_DIAGNOSTIC_PREFIXES = {
+    disease: {s: frozenset(k for k in symptoms if s.startswith(k)) for s in symptoms}
+    for disease, symptoms in DIAGNOSTIC_SYMPTOMS.items()
+}
+
+def count_diagnostic_symptoms(symptoms: str, disease: str, stop_at: Optional[int] = None) -> int:
+    """Count how many diagnostic symptoms are present (at most stop_at, if given)"""
     disease_lower = disease.lower()
     
     # Apply disease aliases
     disease_lower = DISEASE_ALIASES.get(disease_lower, disease_lower)
     
-    count = 0
-    if disease_lower in DIAGNOSTIC_SYMPTOMS:
-        for diagnostic_symptom in DIAGNOSTIC_SYMPTOMS[disease_lower]:
-            if diagnostic_symptom in symptoms_lower:
-                count += 1
-    
-    return count
+    pattern = _DIAGNOSTIC_PATTERNS.get(disease_lower)
+    if pattern is None:
+        return 0
+    prefixes = _DIAGNOSTIC_PREFIXES[disease_lower]
+    found = set()
+    for match in pattern.finditer(symptoms.lower()):
+        found |= prefixes[match.group(1)]
+        if stop_at is not None and len(found) >= stop_at:
+            # One match can add several prefix symptoms at once
+            return stop_at
+    return len(found)
 
-def calibrate_confidence(raw_confidence: float, symptoms: str, disease: str, 
-                        structured_data: dict) -> float:
-    """Calibrate confidence based on symptom quality and diagnostic markers"""
-    # Guard against missing structured data
-    structured_data = structured_data or {}
-    
+# Boost for 0, 1, 2 and 3+ diagnostic symptoms present
+_DIAGNOSTIC_BOOST = (0.0, 0.05, 0.10, 0.15)
+
+# Structured symptom checkboxes counted by calibrate_confidence
+STRUCTURED_SYMPTOM_KEYS = (
+    'fever', 'cough', 'headache', 'fatigue', 'body_pain',
+    'nausea', 'breathing', 'rash', 'diarrhea', 'vomiting'
+)
+
+def _calibration_kernel(raw_confidence: float, diagnostic_count: int, has_duration: bool,
+                        severity: int, symptom_count: int, checked_count: int) -> float:
+    """Combine the extracted calibration features into the final confidence"""
     calibrated = raw_confidence
     
     # Boost 1: Diagnostic symptoms present
-    diagnostic_count = count_diagnostic_symptoms(symptoms, disease)
-    if diagnostic_count >= 3:
-        calibrated += 0.15  # Strong boost for 3+ diagnostic symptoms
-    elif diagnostic_count == 2:
-        calibrated += 0.10  # Medium boost
-    elif diagnostic_count == 1:
-        calibrated += 0.05  # Small boost
+    calibrated += _DIAGNOSTIC_BOOST[min(diagnostic_count, 3)]
     
     # Boost 2: Duration specified (shows patient is providing detail)
-    duration = structured_data.get('duration', 'Not specified')
-    if duration != 'Not specified':
+    if has_duration:
         calibrated += 0.05
     
     # Boost 3: High severity with specific symptoms (usually more accurate)
-    severity = structured_data.get('severity_level', 5)
-    symptom_count = len(symptoms.split())
     if severity >= 7 and symptom_count >= 5:
         calibrated += 0.08
     
     # Boost 4: Multiple structured symptoms checked (better quality data)
-    checked_count = sum([
-        structured_data.get('fever', False),
-        structured_data.get('cough', False),
-        structured_data.get('headache', False),
-        structured_data.get('fatigue', False),
-        structured_data.get('body_pain', False),
-        structured_data.get('nausea', False),
-        structured_data.get('breathing', False),
-        structured_data.get('rash', False),
-        structured_data.get('diarrhea', False),
-        structured_data.get('vomiting', False)
-    ])
     if checked_count >= 4:
         calibrated += 0.10
     elif checked_count >= 2:
@@ -150,36 +156,63 @@ def calibrate_confidence(raw_confidence: float, symptoms: str, disease: str,
         calibrated = min(raw_confidence + max_boost, calibrated)
     
     # Cap at 0.95 (never claim 100% certainty) and floor at 0.05
-    calibrated = max(0.05, min(0.95, calibrated))
+    return max(0.05, min(0.95, calibrated))
+
+def calibrate_confidence(raw_confidence: float, symptoms: str, disease: str, 
+                        structured_data: dict) -> float:
+    """Calibrate confidence based on symptom quality and diagnostic markers"""
+    # Guard against missing structured data
+    structured_data = structured_data or {}
     
-    return calibrated
+    # Text features (one pass over the text, see _DIAGNOSTIC_PATTERNS)
+    diagnostic_count = count_diagnostic_symptoms(
+        symptoms, disease, stop_at=len(_DIAGNOSTIC_BOOST) - 1
+    )
+    symptom_count = len(symptoms.split())
+    
+    # Structured features
+    has_duration = structured_data.get('duration', 'Not specified') != 'Not specified'
+    severity = structured_data.get('severity_level', 5)
+    checked_count = sum(structured_data.get(key, False) for key in STRUCTURED_SYMPTOM_KEYS)
+    
+    return _calibration_kernel(raw_confidence, diagnostic_count, has_duration,
+                               severity, symptom_count, checked_count)
+
+# Common misspellings and synonyms, applied in order by normalize_symptoms
+SYMPTOM_REPLACEMENTS = {
+    "temp": "fever", "temperature": "fever", "high temp": "high fever",
+    "ache": "pain", "aches": "pain", "aching": "pain",
+    "tired": "fatigue", "exhausted": "fatigue", "weakness": "fatigue",
+    "throw up": "vomiting", "throwing up": "vomiting", "puke": "vomiting",
+    "pee": "urination", "peeing": "urination", "urinate": "urination",
+    "dizzy": "dizziness", "lightheaded": "dizziness",
+    "stuffy nose": "nasal congestion", "blocked nose": "nasal congestion",
+    "runny nose": "rhinorrhea", "sore throat": "pharyngitis",
+    "chest pain": "thoracic pain", "stomach pain": "abdominal pain",
+    "belly pain": "abdominal pain", "tummy ache": "abdominal pain"
+}
+
+# Built once at import so each call only walks the prepared rule pairs
+_NORMALIZE_RULES = tuple(SYMPTOM_REPLACEMENTS.items())
 
 def normalize_symptoms(text: str) -> str:
     """Normalize symptom text for better matching"""
-    text = text.lower().strip()
-    
-    # Common misspellings and synonyms
-    replacements = {
-        "temp": "fever", "temperature": "fever", "high temp": "high fever",
-        "ache": "pain", "aches": "pain", "aching": "pain",
-        "tired": "fatigue", "exhausted": "fatigue", "weakness": "fatigue",
-        "throw up": "vomiting", "throwing up": "vomiting", "puke": "vomiting",
-        "pee": "urination", "peeing": "urination", "urinate": "urination",
-        "dizzy": "dizziness", "lightheaded": "dizziness",
-        "stuffy nose": "nasal congestion", "blocked nose": "nasal congestion",
-        "runny nose": "rhinorrhea", "sore throat": "pharyngitis",
-        "chest pain": "thoracic pain", "stomach pain": "abdominal pain",
-        "belly pain": "abdominal pain", "tummy ache": "abdominal pain"
-    }
+    # Collapse whitespace runs first so the multi-word keys only ever need
+    # a literal single space ("stuffy\t nose" -> "stuffy nose")
+    text = " ".join(text.lower().split())
     
-    for wrong, correct in replacements.items():
+    for wrong, correct in _NORMALIZE_RULES:
         text = text.replace(wrong, correct)
     
     return text
 
-def enhance_symptoms_with_context(symptoms: str, structured_data: dict) -> str:
-    """Add structured context to improve confidence"""
-    enhanced = normalize_symptoms(symptoms)
+def enhance_symptoms_with_context(symptoms: str, structured_data: dict,
+                                  normalized: Optional[str] = None) -> str:
+    """Add structured context to improve confidence
+    
+    Pass normalized if the caller already has normalize_symptoms(symptoms).
+    """
+    enhanced = normalized if normalized is not None else normalize_symptoms(symptoms)
     
     # Add checked symptoms
     checked_symptoms = []
@@ -763,13 +796,15 @@ def display_herbal_recommendations(ingredients: list):
             st.markdown(f"**Usage:** {usage}")
             st.progress(score, text=f"Relevance: {score*100:.0f}%")
 
+# Medication types hidden when antibiotics are withheld
+_ANTIBIOTIC_TYPE_RE = re.compile("antibiotic|antibacterial|antimicrobial")
+
 def display_pharmaceutical_recommendations(medications: list, disease: str, do_not_show_antibiotics: bool = False):
     """Display pharmaceutical recommendations with safety highlights"""
     
     def is_antibiotic(med: dict) -> bool:
         """Check if medication is an antibiotic"""
-        med_type = med.get('type', '').lower()
-        return any(keyword in med_type for keyword in ['antibiotic', 'antibacterial', 'antimicrobial'])
+        return _ANTIBIOTIC_TYPE_RE.search(med.get('type', '').lower()) is not None
     
     # Filter out antibiotics if confidence too low
     if do_not_show_antibiotics:
@@ -1021,10 +1056,13 @@ def main():
             st.error("⚠️ Please enter your symptoms first")
         else:
             # Enhance symptoms with structured data
-            enhanced_symptoms = enhance_symptoms_with_context(symptoms, structured_data)
+            normalized_symptoms = normalize_symptoms(symptoms)
+            enhanced_symptoms = enhance_symptoms_with_context(
+                symptoms, structured_data, normalized=normalized_symptoms
+            )
             
             # Show what was processed
-            if enhanced_symptoms != normalize_symptoms(symptoms):
+            if enhanced_symptoms != normalized_symptoms:
                 with st.expander("🔍 Enhanced Symptom Analysis"):
                     st.success("✅ Your input was enhanced with structured data for better accuracy!")
                     st.markdown(f"**Original:** {symptoms}")
@@ -4,8 +4,18 @@ Comprehensive test for all major diseases with generic symptoms
 Identifies issues similar to the Dengue problem
 """
 
+import re
+
 from src.ai_assistant import load_knowledge_base, generate_comprehensive_answer
 
+_BAR = "=" * 100
+_HR = "-" * 100
+
+SERIOUS_DISEASES = ['dengue', 'malaria', 'covid', 'diabetes', 'hypertension', 'asthma',
+                    'typhoid', 'tuberculosis', 'pneumonia', 'meningitis']
+# One compiled alternation scans the disease name once instead of N substring checks
+_SERIOUS_RE = re.compile("|".join(map(re.escape, SERIOUS_DISEASES)))
+
 # Test cases: Generic symptoms that might falsely trigger specific diseases
 test_cases = [
     # Generic symptoms
@@ -31,22 +41,28 @@ test_cases = [
     ("wheezing, shortness of breath, chest tightness", "Asthma - HIGH confidence"),
 ]
 
-print("=" * 100)
+# Aligned columns of the test cases
+symptoms_col, expected_col = zip(*test_cases)
+
+print(_BAR)
 print("COMPREHENSIVE DISEASE DIAGNOSIS TEST")
 print("Checking for over-diagnosis from generic symptoms")
-print("=" * 100)
+print(_BAR)
 print()
 
 # Load knowledge base
 knowledge = load_knowledge_base()
 
+# Good cases only bump a counter; issues keep a record for the summary
 issues_found = []
-good_cases = []
+good_count = 0
 
-for i, (symptoms, expected) in enumerate(test_cases, 1):
+for i, (symptoms, expected) in enumerate(zip(symptoms_col, expected_col), 1):
+    symptoms_lower = symptoms.lower()
+    word_count = len(symptoms.split())
     print(f"TEST {i}: '{symptoms}'")
     print(f"Expected: {expected}")
-    print("-" * 100)
+    print(_HR)
     
     response = generate_comprehensive_answer(symptoms, knowledge, use_advanced=False)
     
@@ -59,11 +75,8 @@ for i, (symptoms, expected) in enumerate(test_cases, 1):
     
     # Check for potential issues
     disease_lower = disease.lower()
-    serious_diseases = ['dengue', 'malaria', 'covid', 'diabetes', 'hypertension', 'asthma', 
-                       'typhoid', 'tuberculosis', 'pneumonia', 'meningitis']
-    
-    is_serious_disease = any(sd in disease_lower for sd in serious_diseases)
-    is_generic_symptoms = len(symptoms.split()) <= 3 and 'severe' not in symptoms.lower()
+    is_serious_disease = _SERIOUS_RE.search(disease_lower) is not None
+    is_generic_symptoms = word_count <= 3 and 'severe' not in symptoms_lower
     
     # Issue 1: Serious disease diagnosed with low confidence from generic symptoms
     if is_serious_disease and confidence < 0.40 and is_generic_symptoms:
@@ -80,12 +93,12 @@ for i, (symptoms, expected) in enumerate(test_cases, 1):
     # Good: Specific symptoms with high confidence
     elif not is_generic_symptoms and confidence >= 0.40:
         print(f"  ✓ GOOD: Specific symptoms + high confidence")
-        good_cases.append(f"Test {i}")
+        good_count += 1
     
     # Good: Generic symptoms with low confidence
     elif is_generic_symptoms and confidence < 0.40:
         print(f"  ✓ GOOD: Generic symptoms correctly identified (low confidence)")
-        good_cases.append(f"Test {i}")
+        good_count += 1
     
     else:
         print(f"  ℹ️  OK: Reasonable diagnosis")
@@ -93,11 +106,11 @@ for i, (symptoms, expected) in enumerate(test_cases, 1):
     print()
 
 # Summary
-print("=" * 100)
+print(_BAR)
 print("SUMMARY")
-print("=" * 100)
+print(_BAR)
 print(f"Total tests: {len(test_cases)}")
-print(f"Good cases: {len(good_cases)}")
+print(f"Good cases: {good_count}")
 print(f"Issues found: {len(issues_found)}")
 print()
 
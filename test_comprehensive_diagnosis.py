@@ -4,11 +4,29 @@ COMPREHENSIVE TEST SUITE
 Tests all disease diagnosis improvements to prevent over-diagnosis from generic symptoms
 """
 
+import os
+import re
+
 from src.ai_assistant import load_knowledge_base, generate_comprehensive_answer
 
-print("=" * 100)
+_BAR = "=" * 100
+_HR = "-" * 100
+
+SERIOUS_DISEASES = ['dengue', 'malaria', 'covid', 'diabetes', 'hypertension',
+                    'asthma', 'typhoid', 'tuberculosis', 'pneumonia']
+CRITICAL_PHRASES = ['CRITICAL:', 'MEDICATION FOR DENGUE', 'MEDICATION FOR MALARIA',
+                    'MEDICATION FOR COVID', 'strictly avoided', 'ONLY safe option']
+# Compiled alternations scan the text once instead of N substring checks per case
+_SERIOUS_RE = re.compile("|".join(map(re.escape, SERIOUS_DISEASES)))
+_CRITICAL_RE = re.compile("|".join(map(re.escape, CRITICAL_PHRASES)))
+
+# AI insight snippets are display-only; set CUREBLEND_TEST_VERBOSE=1 to print them
+VERBOSE = os.environ.get("CUREBLEND_TEST_VERBOSE") == "1"
+_NEWLINES_TO_SPACES = str.maketrans('\n', ' ')
+
+print(_BAR)
 print("COMPREHENSIVE DISEASE DIAGNOSIS VALIDATION TEST")
-print("=" * 100)
+print(_BAR)
 print()
 
 # Load knowledge base once
@@ -51,104 +69,99 @@ test_scenarios = {
     ],
 }
 
+# Flatten the scenarios into aligned columns, one entry per test case
+symptoms_col, expected_col, category_col = zip(*(
+    (symptoms, expected, category)
+    for category, cases in test_scenarios.items()
+    for symptoms, expected in cases
+))
+
 # Track results
-all_results = []
+# Passing cases only bump a counter; failures keep a record for the summary
+total_tests = 0
+passed = 0
 issues_found = []
-good_cases = []
 
-for category, tests in test_scenarios.items():
-    print(f"\n{'='*100}")
-    print(f"CATEGORY: {category}")
-    print('='*100)
+current_category = None
+for symptoms, expected, category in zip(symptoms_col, expected_col, category_col):
+    if category != current_category:
+        current_category = category
+        print("\n" + _BAR, f"CATEGORY: {category}", _BAR, sep="\n")
     
-    for symptoms, expected_behavior in tests:
-        print(f"\nTest: '{symptoms}'")
-        print(f"Expected: {expected_behavior}")
-        print("-" * 100)
-        
-        response = generate_comprehensive_answer(symptoms, knowledge)
+    print(f"\nTest: '{symptoms}'")
+    print(f"Expected: {expected}")
+    print(_HR)
         
-        disease = response.get('detected_disease', '')
-        confidence = response.get('confidence', 0.0)
-        confidence_pct = confidence * 100
-        ai_insights = response.get('ai_insights', '')
+    response = generate_comprehensive_answer(symptoms, knowledge)
         
-        print(f"  Detected: {disease}")
-        print(f"  Confidence: {confidence_pct:.1f}%")
+    disease = response.get('detected_disease', '')
+    confidence = response.get('confidence', 0.0)
+    confidence_pct = confidence * 100
+    ai_insights = response.get('ai_insights', '')
         
-        # Validation logic
-        disease_lower = disease.lower()
-        serious_diseases = ['dengue', 'malaria', 'covid', 'diabetes', 'hypertension', 
-                           'asthma', 'typhoid', 'tuberculosis', 'pneumonia']
+    print(f"  Detected: {disease}")
+    print(f"  Confidence: {confidence_pct:.1f}%")
         
-        is_serious = any(sd in disease_lower for sd in serious_diseases)
-        is_generic_input = len(symptoms.split()) <= 4 and not any(kw in symptoms.lower() for kw in 
-            ['severe', 'loss of', 'excessive', 'frequent', 'intermittent', 'cyclic', 'bleeding'])
+    # Validation logic
+    disease_lower = disease.lower()
+    is_serious = _SERIOUS_RE.search(disease_lower) is not None
         
-        # Check for disease-specific warnings in AI insights
-        has_specific_warnings = False
-        if ai_insights:
-            critical_phrases = ['CRITICAL:', 'MEDICATION FOR DENGUE', 'MEDICATION FOR MALARIA', 
-                              'MEDICATION FOR COVID', 'strictly avoided', 'ONLY safe option']
-            has_specific_warnings = any(phrase in ai_insights for phrase in critical_phrases)
+    # Check for disease-specific warnings in AI insights
+    has_specific_warnings = False
+    if ai_insights:
+        has_specific_warnings = _CRITICAL_RE.search(ai_insights) is not None
         
-        # Validation rules
-        status = "✓"
-        issue = None
+    # Validation rules
+    status = "✓"
+    issue = None
         
-        # Rule 1: Generic symptoms should have low confidence (<40%)
-        if "Generic Symptoms" in category:
-            if is_serious and confidence >= 0.40:
-                status = "❌"
-                issue = f"Serious disease ({disease}) with high confidence from generic symptoms"
-            elif confidence < 0.40:
-                status = "✓"
-                result = "Correctly flagged as low confidence"
-            else:
-                status = "✓"
-                result = "Reasonable diagnosis"
-        
-        # Rule 2: Specific symptoms should have higher confidence (>=40%)
-        elif "Specific" in category or "Other Serious" in category:
-            if confidence >= 0.40:
-                status = "✓"
-                result = "Good: Specific symptoms with appropriate confidence"
-            else:
-                status = "⚠️ "
-                issue = f"Specific symptoms but low confidence ({confidence_pct:.1f}%)"
-        
-        # Rule 3: Low confidence should NOT show disease-specific critical warnings
-        if confidence < 0.40 and has_specific_warnings:
+    # Rule 1: Generic symptoms should have low confidence (<40%)
+    if "Generic Symptoms" in category:
+        if is_serious and confidence >= 0.40:
             status = "❌"
-            issue = f"Disease-specific warnings shown despite low confidence ({confidence_pct:.1f}%)"
+            issue = f"Serious disease ({disease}) with high confidence from generic symptoms"
+        elif confidence < 0.40:
+            status = "✓"
+            result = "Correctly flagged as low confidence"
+        else:
+            status = "✓"
+            result = "Reasonable diagnosis"
         
-        # Print result
-        if issue:
-            print(f"  {status} ISSUE: {issue}")
-            issues_found.append(f"{symptoms} → {issue}")
+    # Rule 2: Specific symptoms should have higher confidence (>=40%)
+    elif "Specific" in category or "Other Serious" in category:
+        if confidence >= 0.40:
+            status = "✓"
+            result = "Good: Specific symptoms with appropriate confidence"
         else:
-            print(f"  {status} PASS")
-            good_cases.append(symptoms)
+            status = "⚠️ "
+            issue = f"Specific symptoms but low confidence ({confidence_pct:.1f}%)"
+        
+    # Rule 3: Low confidence should NOT show disease-specific critical warnings
+    if confidence < 0.40 and has_specific_warnings:
+        status = "❌"
+        issue = f"Disease-specific warnings shown despite low confidence ({confidence_pct:.1f}%)"
+        
+    # Print result
+    if issue:
+        print(f"  {status} ISSUE: {issue}")
+        issues_found.append(f"{symptoms} → {issue}")
+    else:
+        print(f"  {status} PASS")
+        passed += 1
         
-        # Show snippet of AI insights if present
-        if ai_insights and len(ai_insights) > 100:
-            snippet = ai_insights[:150].replace('\n', ' ')
-            print(f"  AI Insights: {snippet}...")
+    # Show snippet of AI insights if present
+    if VERBOSE and ai_insights and len(ai_insights) > 100:
+        snippet = ai_insights[:150].translate(_NEWLINES_TO_SPACES)
+        print(f"  AI Insights: {snippet}...")
         
-        all_results.append({
-            'symptoms': symptoms,
-            'disease': disease,
-            'confidence': confidence,
-            'status': status,
-            'issue': issue
-        })
+    total_tests += 1
 
 # Final Summary
-print("\n" + "=" * 100)
+print("\n" + _BAR)
 print("FINAL SUMMARY")
-print("=" * 100)
-print(f"Total tests: {len(all_results)}")
-print(f"Passed: {len(good_cases)}")
+print(_BAR)
+print(f"Total tests: {total_tests}")
+print(f"Passed: {passed}")
 print(f"Issues: {len(issues_found)}")
 print()
 
@@ -167,4 +180,4 @@ else:
     print("  • Provides generic guidance for low confidence cases")
 
 print()
-print("=" * 100)
+print(_BAR)
@@ -4,11 +4,9 @@ Comprehensive Test for Enhanced Recommendations System
 Tests pharmaceutical and herbal recommendations across common conditions
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from src.ai_assistant import suggest_drugs_for_disease, suggest_ingredients_for_disease
 
-from src.ai_assistant import AIAssistant, suggest_drugs_for_disease, suggest_ingredients_for_disease
+_BAR = "=" * 80
 
 def test_conditions():
     """Test a wide range of common conditions"""
@@ -60,21 +58,19 @@ def test_conditions():
         ("weak immunity", "Immunity"),
     ]
     
-    print("="*80)
+    print(_BAR)
     print("🧪 COMPREHENSIVE RECOMMENDATIONS TEST")
-    print("="*80)
+    print(_BAR)
     print(f"\nTesting {len(test_cases)} common conditions...\n")
     
     passed = 0
     failed = 0
     warnings = 0
     
-    ai = AIAssistant()
-    
     for condition, category in test_cases:
-        print(f"\n{'='*80}")
+        print(f"\n{_BAR}")
         print(f"🔍 Condition: {condition} ({category})")
-        print(f"{'='*80}")
+        print(f"{_BAR}")
         
         # Test pharmaceutical recommendations
         print("\n💊 Pharmaceutical Recommendations:")
@@ -111,15 +107,15 @@ def test_conditions():
             failed += 1
     
     # Summary
-    print("\n" + "="*80)
+    print("\n" + _BAR)
     print("📊 TEST SUMMARY")
-    print("="*80)
+    print(_BAR)
     print(f"Total Conditions Tested: {len(test_cases)}")
     print(f"✅ Passed: {passed}")
     print(f"⚠️  Warnings: {warnings}")
     print(f"❌ Failed: {failed}")
     print(f"Success Rate: {(passed/(passed+failed)*100):.1f}%")
-    print("="*80)
+    print(_BAR)
     
     if failed == 0:
         print("\n🎉 ALL TESTS PASSED! Comprehensive coverage achieved.")
@@ -128,7 +124,7 @@ def test_conditions():
     else:
         print("\n⚠️  NEEDS IMPROVEMENT - Some conditions lack proper recommendations.")
     
-    print("\n" + "="*80)
+    print("\n" + _BAR)
 
 if __name__ == "__main__":
     test_conditions()
@@ -2,15 +2,14 @@
 """
 Quick test for pharmaceutical recommendations in terminal
 """
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
 from src.ai_assistant import suggest_drugs_for_disease
 
-print("="*70)
+_BAR = "=" * 70
+_HR = "-" * 70
+
+print(_BAR)
 print("🧪 Testing Pharmaceutical Recommendations")
-print("="*70)
+print(_BAR)
 print()
 
 # Test different conditions
@@ -25,7 +24,7 @@ test_conditions = [
 
 for condition in test_conditions:
     print(f"\n🔍 Testing: {condition}")
-    print("-" * 70)
+    print(_HR)
     drugs = suggest_drugs_for_disease(condition, top_n=5)
     
     if drugs:
@@ -36,9 +35,9 @@ for condition in test_conditions:
     else:
         print(f"❌ No drugs found (THIS IS THE PROBLEM!)")
 
-print("\n" + "="*70)
+print("\n" + _BAR)
 print("✅ Test Complete!")
-print("="*70)
+print(_BAR)
 print()
 print("If all conditions show drug recommendations, the fix is working!")
 print()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Test the knowledge-base pickle cache against temporary data directories
+"""
+import os
+import stat
+import sys
+import tempfile
+
+import pandas as pd
+
+from src import ai_assistant
+from src.ai_assistant import (
+    KB_CACHE_FILE, SAMPLE_DISEASES, SAMPLE_HERBS, SAMPLE_INGREDIENTS, SAMPLE_TARGETS,
+    load_knowledge_base
+)
+
+def _write_kb(data_dir):
+    """Write the embedded sample rows as the four KB source CSVs"""
+    for name, rows in (("diseases.csv", SAMPLE_DISEASES), ("herbs.csv", SAMPLE_HERBS),
+                       ("ingredients.csv", SAMPLE_INGREDIENTS), ("targets.csv", SAMPLE_TARGETS)):
+        pd.DataFrame(rows).to_csv(os.path.join(data_dir, name), index=False)
+
+def _load_counting_builds(data_dir):
+    """Load data_dir as a fresh process would; returns the knowledge base and
+    how many times it had to be built from the CSVs"""
+    builds = []
+    build = ai_assistant._build_knowledge_base
+    def counting_build(path):
+        builds.append(path)
+        return build(path)
+    ai_assistant._build_knowledge_base = counting_build
+    load_knowledge_base.cache_clear()
+    try:
+        return load_knowledge_base(data_dir), len(builds)
+    finally:
+        ai_assistant._build_knowledge_base = build
+        load_knowledge_base.cache_clear()
+
+def test_cache_hit(data_dir):
+    """A second process start reuses the pickle instead of parsing the CSVs"""
+    _write_kb(data_dir)
+    built, builds = _load_counting_builds(data_dir)
+    assert builds == 1, f"first load built {builds} times"
+    assert os.path.exists(os.path.join(data_dir, KB_CACHE_FILE)), "cache file not written"
+
+    cached, builds = _load_counting_builds(data_dir)
+    assert builds == 0, "second load did not use the cache"
+    assert cached["herbs"].equals(built["herbs"]), "cached herbs differ"
+    assert cached["herb_index"] == built["herb_index"], "cached herb index differs"
+
+def test_cache_invalidated_by_csv_change(data_dir):
+    """Editing a source CSV makes the next process rebuild from the CSVs"""
+    _write_kb(data_dir)
+    _load_counting_builds(data_dir)
+    herbs_path = os.path.join(data_dir, "herbs.csv")
+    herbs = pd.read_csv(herbs_path)
+    herbs = pd.concat([herbs, herbs.iloc[[0]].assign(herb="Test Herb")], ignore_index=True)
+    herbs.to_csv(herbs_path, index=False)
+
+    knowledge, builds = _load_counting_builds(data_dir)
+    assert builds == 1, "stale cache used after the CSV changed"
+    assert "Test Herb" in set(knowledge["herbs"]["herb"]), "new CSV row missing"
+
+    _, builds = _load_counting_builds(data_dir)
+    assert builds == 0, "rebuilt cache not reused"
+
+def test_latin1_csv_fallback(data_dir):
+    """A CSV that is not valid UTF-8 is read again as latin-1, whichever
+    parser engine is in use, so its text is decoded rather than bytes"""
+    _write_kb(data_dir)
+    herbs_path = os.path.join(data_dir, "herbs.csv")
+    herbs = pd.read_csv(herbs_path)
+    herbs.loc[len(herbs) - 1, "benefits"] = "Café-style tea for digestion"
+    herbs.to_csv(herbs_path, index=False, encoding="latin-1")
+
+    knowledge, _ = _load_counting_builds(data_dir)
+    benefits = list(knowledge["herbs"]["benefits"])
+    assert all(isinstance(b, str) for b in benefits), "undecoded bytes in herbs"
+    assert "Café-style tea for digestion" in benefits, "latin-1 text decoded wrongly"
+
+def test_herb_index_matches_scan(data_dir):
+    """Herb lookups through the cached herb_index return what the row scan
+    does, including case-only duplicates (first row wins) and unknown names"""
+    _write_kb(data_dir)
+    herbs_path = os.path.join(data_dir, "herbs.csv")
+    herbs = pd.read_csv(herbs_path)
+    duplicate = herbs.iloc[[0]].assign(herb=herbs.loc[0, "herb"].upper(), benefits="Later duplicate")
+    herbs = pd.concat([herbs, duplicate], ignore_index=True)
+    herbs.to_csv(herbs_path, index=False)
+    _load_counting_builds(data_dir)
+
+    knowledge, builds = _load_counting_builds(data_dir)
+    assert builds == 0, "index not loaded from the cache"
+    names = list(knowledge["herbs"]["herb"]) + ["not a herb"]
+    for name in names:
+        indexed = ai_assistant.get_herb_info(name, knowledge["herbs"], knowledge["herb_index"])
+        scanned = ai_assistant.get_herb_info(name, knowledge["herbs"])
+        assert indexed == scanned, f"herb_index lookup of {name!r} differs from the scan"
+
+def test_untrusted_cache_ignored(data_dir):
+    """A cache file others can write is rebuilt, never unpickled"""
+    if not hasattr(os, "getuid"):
+        return  # no POSIX permissions to check
+    _write_kb(data_dir)
+    _load_counting_builds(data_dir)
+    cache_path = os.path.join(data_dir, KB_CACHE_FILE)
+    os.chmod(cache_path, 0o666)
+
+    _, builds = _load_counting_builds(data_dir)
+    assert builds == 1, "group/world-writable cache was loaded"
+    mode = os.stat(cache_path).st_mode
+    assert not mode & (stat.S_IWGRP | stat.S_IWOTH), "rewritten cache is still writable by others"
+
+TESTS = [
+    test_cache_hit,
+    test_cache_invalidated_by_csv_change,
+    test_latin1_csv_fallback,
+    test_herb_index_matches_scan,
+    test_untrusted_cache_ignored,
+]
+
+def run_tests():
+    """Run each test in its own temporary data dir"""
+    print("=" * 70)
+    print("KNOWLEDGE BASE CACHE TEST")
+    print("=" * 70)
+    print()
+
+    failed = 0
+    for test in TESTS:
+        with tempfile.TemporaryDirectory() as data_dir:
+            try:
+                test(data_dir)
+                print(f"✓ {test.__name__}")
+            except AssertionError as e:
+                print(f"✗ {test.__name__}: {e}")
+                failed += 1
+
+    print()
+    print("=" * 70)
+    print(f"TEST RESULTS: {len(TESTS) - failed} passed, {failed} failed")
+    print("=" * 70)
+    return failed == 0
+
+if __name__ == "__main__":
+    success = run_tests()
+    sys.exit(0 if success else 1)
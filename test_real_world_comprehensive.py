@@ -6,11 +6,18 @@ Tests complex inputs, edge cases, and ambiguous scenarios
 
 from src.ai_assistant import load_knowledge_base, generate_comprehensive_answer
 import json
+try:
+    import orjson
+except Exception:
+    orjson = None
 
-print("=" * 100)
+_BAR = "=" * 100
+_HR = "-" * 100
+
+print(_BAR)
 print("COMPREHENSIVE REAL-WORLD DIAGNOSIS TEST")
 print("Testing complex inputs, edge cases, and ambiguous scenarios")
-print("=" * 100)
+print(_BAR)
 print()
 
 # Load knowledge base
@@ -141,16 +148,14 @@ failed = 0
 results_log = []
 
 for category, tests in test_categories.items():
-    print(f"\n{'='*100}")
-    print(f"{category}")
-    print('='*100)
+    print("\n" + _BAR, category, _BAR, sep="\n")
     
     for symptoms, expected_disease, confidence_threshold, description in tests:
         total_tests += 1
         print(f"\n{total_tests}. {description}")
         print(f"   Input: '{symptoms}'")
         print(f"   Expected: {expected_disease or 'Low confidence / Generic'} (conf >= {confidence_threshold}%)")
-        print("-" * 100)
+        print(_HR)
         
         try:
             response = generate_comprehensive_answer(symptoms, knowledge)
@@ -165,7 +170,7 @@ for category, tests in test_categories.items():
             
             # Validation logic
             status = "✓"
-            issue = None
+            issue_parts = []
             
             if expected_disease:
                 # Expected specific disease
@@ -178,12 +183,12 @@ for category, tests in test_categories.items():
                     passed += 1
                 elif disease_match and not confidence_ok:
                     status = "⚠️"
-                    issue = f"Correct disease but confidence too low ({confidence_pct:.1f}% < {confidence_threshold}%)"
+                    issue_parts.append(f"Correct disease but confidence too low ({confidence_pct:.1f}% < {confidence_threshold}%)")
                     result = "WARNING"
                     warnings += 1
                 else:
                     status = "❌"
-                    issue = f"Wrong disease: expected {expected_disease}, got {disease}"
+                    issue_parts.append(f"Wrong disease: expected {expected_disease}, got {disease}")
                     result = "FAIL"
                     failed += 1
             else:
@@ -194,7 +199,7 @@ for category, tests in test_categories.items():
                     passed += 1
                 else:
                     status = "⚠️"
-                    issue = f"Confidence too high for ambiguous symptoms ({confidence_pct:.1f}%)"
+                    issue_parts.append(f"Confidence too high for ambiguous symptoms ({confidence_pct:.1f}%)")
                     result = "WARNING"
                     warnings += 1
             
@@ -206,11 +211,12 @@ for category, tests in test_categories.items():
                 
                 if has_critical:
                     status = "❌"
-                    issue = (issue or "") + " | Disease-specific warnings at low confidence"
+                    issue_parts.append("Disease-specific warnings at low confidence")
                     result = "FAIL"
                     if result != "FAIL":
                         failed += 1
             
+            issue = " | ".join(issue_parts) or None
             print(f"   {status} {result}", end="")
             if issue:
                 print(f": {issue}")
@@ -241,9 +247,9 @@ for category, tests in test_categories.items():
             })
 
 # Final Summary
-print("\n" + "=" * 100)
+print("\n" + _BAR)
 print("FINAL SUMMARY")
-print("=" * 100)
+print(_BAR)
 print(f"Total tests: {total_tests}")
 print(f"✓ Passed: {passed}")
 print(f"⚠️  Warnings: {warnings}")
@@ -253,23 +259,33 @@ print()
 pass_rate = (passed / total_tests * 100) if total_tests > 0 else 0
 print(f"Pass rate: {pass_rate:.1f}%")
 
+# Bucket results by status in one pass for the failure/warning listings
+failed_log, warning_log = [], []
+for r in results_log:
+    if r['status'] in ('FAIL', 'ERROR'):
+        failed_log.append(r)
+    elif r['status'] == 'WARNING':
+        warning_log.append(r)
+
+def _listing(entries):
+    lines = []
+    for r in entries:
+        lines.append(f"  • Test {r['test_num']}: {r['description']}")
+        if r.get('issue'):
+            lines.append(f"    Issue: {r['issue']}")
+    return "\n".join(lines)
+
 if failed > 0:
     print(f"\n❌ {failed} CRITICAL FAILURES")
     print("Failed tests:")
-    for r in results_log:
-        if r.get('status') == 'FAIL' or r.get('status') == 'ERROR':
-            print(f"  • Test {r['test_num']}: {r['description']}")
-            if r.get('issue'):
-                print(f"    Issue: {r['issue']}")
+    if failed_log:
+        print(_listing(failed_log))
 
 if warnings > 0:
     print(f"\n⚠️  {warnings} WARNINGS")
     print("Tests needing review:")
-    for r in results_log:
-        if r.get('status') == 'WARNING':
-            print(f"  • Test {r['test_num']}: {r['description']}")
-            if r.get('issue'):
-                print(f"    Issue: {r['issue']}")
+    if warning_log:
+        print(_listing(warning_log))
 
 if failed == 0 and warnings == 0:
     print("\n✅ ALL TESTS PASSED!")
@@ -289,9 +305,13 @@ else:
     print(f"\n⚠️  NEEDS IMPROVEMENT: {pass_rate:.1f}% pass rate")
     print("Several scenarios need attention")
 
-print("\n" + "=" * 100)
+print("\n" + _BAR)
 
 # Save detailed results
-with open('test_results_comprehensive.json', 'w') as f:
-    json.dump(results_log, f, indent=2)
+if orjson is not None:
+    with open('test_results_comprehensive.json', 'wb') as f:
+        f.write(orjson.dumps(results_log, option=orjson.OPT_INDENT_2))
+else:
+    with open('test_results_comprehensive.json', 'w') as f:
+        json.dump(results_log, f, indent=2)
 print("Detailed results saved to: test_results_comprehensive.json")
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Test the printed reports of the diagnosis test scripts
+"""
+import json
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+def _run_script(name, **env):
+    """Run a root-level script and return its stdout"""
+    result = subprocess.run(
+        [sys.executable, name], cwd=PROJECT_ROOT, env={**os.environ, **env},
+        capture_output=True, text=True, check=True
+    )
+    return result.stdout
+
+def test_diagnosis_insights_verbose_only():
+    """AI insight snippets print only with CUREBLEND_TEST_VERBOSE=1, and
+    turning them on adds those lines without changing any other line"""
+    quiet = _run_script("test_comprehensive_diagnosis.py", CUREBLEND_TEST_VERBOSE="0").splitlines()
+    verbose = _run_script("test_comprehensive_diagnosis.py", CUREBLEND_TEST_VERBOSE="1").splitlines()
+    snippet_lines = [line for line in verbose if line.startswith("  AI Insights: ")]
+    assert not any(line.startswith("  AI Insights: ") for line in quiet), "snippets printed without VERBOSE"
+    assert snippet_lines, "no snippets printed with VERBOSE"
+    assert [line for line in verbose if line not in snippet_lines] == quiet, "VERBOSE changed other output"
+
+def test_real_world_issues_joined():
+    """Each non-passing real-world case reports its issues joined with " | ",
+    with no empty part and no leading separator, in both the printed line
+    and the JSON results"""
+    results_path = os.path.join(PROJECT_ROOT, "test_results_comprehensive.json")
+    had_results = os.path.exists(results_path)
+    output = _run_script("test_real_world_comprehensive.py")
+    try:
+        with open(results_path) as f:
+            results = json.load(f)
+    finally:
+        if not had_results:
+            os.remove(results_path)
+
+    for r in results:
+        if r["status"] in ("PASS", "ERROR"):
+            assert r.get("issue") is None, f"test {r['test_num']}: issue on a {r['status']}"
+            continue
+        issue = r["issue"]
+        assert issue and all(issue.split(" | ")), f"test {r['test_num']}: malformed issue {issue!r}"
+        assert f"{r['status']}: {issue}\n" in output, f"test {r['test_num']}: issue not printed"
+
+TESTS = [
+    test_diagnosis_insights_verbose_only,
+    test_real_world_issues_joined,
+]
+
+def run_tests():
+    """Run each report check"""
+    print("=" * 70)
+    print("REPORT OUTPUT TEST")
+    print("=" * 70)
+    print()
+
+    failed = 0
+    for test in TESTS:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except (AssertionError, subprocess.CalledProcessError) as e:
+            print(f"✗ {test.__name__}: {e}")
+            failed += 1
+
+    print()
+    print("=" * 70)
+    print(f"TEST RESULTS: {len(TESTS) - failed} passed, {failed} failed")
+    print("=" * 70)
+    return failed == 0
+
+if __name__ == "__main__":
+    success = run_tests()
+    sys.exit(0 if success else 1)
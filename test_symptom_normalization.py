@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Test symptom text normalization used by the Streamlit app
+"""
+import sys
+
+from streamlit_app import normalize_symptoms
+
+# (raw input, normalized text)
+NORMALIZATION_CASES = [
+    # Whitespace runs collapse to one space, so phrase rules still match
+    ("Stuffy \t nose", "nasal congestion"),
+    ("runny   nose and sore  throat", "rhinorrhea and pharyngitis"),
+    ("High   Temp", "high fever"),
+    ("  fever\n\ncough  ", "fever cough"),
+    # Rules apply in order, each to the output of the ones before it
+    ("chest ache", "thoracic pain"),
+    ("tummy ache", "tummy pain"),
+    ("feeling dizzy and tired", "feeling dizziness and fatigue"),
+    ("throwing up, stomach pain", "vomiting, abdominal pain"),
+]
+
+def test_normalization():
+    """Check each input normalizes to its pinned text"""
+    print("=" * 70)
+    print("SYMPTOM NORMALIZATION TEST")
+    print("=" * 70)
+    print()
+
+    failed = 0
+    for raw, expected in NORMALIZATION_CASES:
+        result = normalize_symptoms(raw)
+        if result == expected:
+            print(f"✓ {raw!r} -> {result!r}")
+        else:
+            print(f"✗ {raw!r} -> {result!r} (expected {expected!r})")
+            failed += 1
+
+    print()
+    print("=" * 70)
+    print(f"TEST RESULTS: {len(NORMALIZATION_CASES) - failed} passed, {failed} failed")
+    print("=" * 70)
+    return failed == 0
+
+if __name__ == "__main__":
+    success = test_normalization()
+    sys.exit(0 if success else 1)
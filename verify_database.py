@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 """Quick verification of database counts"""
-import sys
-sys.path.insert(0, '/workspaces/Cure-Blend')
+from collections import Counter
 
 from src.ai_assistant import SAMPLE_DRUGS
 
@@ -11,12 +10,9 @@ print("="*60)
 print(f"\n💊 Total Pharmaceutical Drugs: {len(SAMPLE_DRUGS)}")
 print(f"\nDrug Categories:")
 
-categories = {}
-for drug in SAMPLE_DRUGS:
-    dtype = drug.get('type', 'Unknown')
-    categories[dtype] = categories.get(dtype, 0) + 1
+categories = Counter(drug.get('type', 'Unknown') for drug in SAMPLE_DRUGS)
 
-for cat, count in sorted(categories.items(), key=lambda x: x[1], reverse=True):
+for cat, count in categories.most_common():
     print(f"   - {cat}: {count}")
 
 print(f"\n✅ Database successfully expanded!")